@@ -1,8 +1,17 @@
 """PDF Squeezer - Reliable PDF compression using multiple strategies."""
 
+from typing import Any
+
 __version__ = "2.1.5"
 __author__ = "Tiago Silva"
 
-from pdf_squeezer.core.compressor import PDFCompressor, CompressionOutcome
-
 __all__ = ["PDFCompressor", "CompressionOutcome", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the compressor so importing the CLI doesn't load pikepdf."""
+    if name in ("PDFCompressor", "CompressionOutcome"):
+        from pdf_squeezer.core import compressor
+
+        return getattr(compressor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,27 +1,41 @@
 """Command-line interface for PDF compression."""
 
+import os
+import stat
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Annotated, List, Optional
+from typing import TYPE_CHECKING, Annotated, Dict, List, Optional, Tuple
 
 import typer
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.table import Table
+from rich.text import Text
 
 from pdf_squeezer import __version__
-from pdf_squeezer.core.compressor import CompressionOutcome, PDFCompressor
-from pdf_squeezer.parallel.executor import ParallelCompressor
 from pdf_squeezer.utils.dependencies import check_dependencies, get_install_instructions
 from pdf_squeezer.utils.filesize import format_size
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from rich.table import Table
+
+    from pdf_squeezer.core.compressor import CompressionOutcome
+
+# Progress, Table and the compressors (which pull in pikepdf) are imported
+# inside the functions that use them, keeping --version/--help startup fast.
+
 app = typer.Typer(
     name="pdf-squeezer",
     help="Reliable PDF compression using multiple strategies.",
     add_completion=False,
     rich_markup_mode="rich",
 )
-console = Console()
+console = Console(highlight=False)
+
+# Quality presets in display order (lowest to highest), plus a set for lookups
+_QUALITY_CHOICES = ("screen", "ebook", "printer", "prepress", "default")
+_VALID_QUALITIES = frozenset(_QUALITY_CHOICES)
+
+# File sizes collected during discovery, reused to avoid re-stat'ing inputs
+_file_sizes: Dict[Path, int] = {}
 
 
 def version_callback(value: bool) -> None:
@@ -38,18 +52,42 @@ def discover_pdf_files(files: Optional[List[Path]]) -> List[Path]:
         resolved = []
         for f in files:
             path = Path(f).resolve()
-            if not path.exists():
+            try:
+                st = path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 console.print(f"[red]Error:[/red] File not found: {f}")
-                raise typer.Exit(1)
-            if path.is_dir():
+                raise typer.Exit(1) from None
+            except OSError as e:
+                console.print(f"[red]Error:[/red] Cannot access {f}: {e.strerror}")
+                raise typer.Exit(1) from None
+            if stat.S_ISDIR(st.st_mode):
                 console.print(f"[red]Error:[/red] Expected file, got directory: {f}")
                 raise typer.Exit(1)
+            _file_sizes[path] = st.st_size
             resolved.append(path)
         return resolved
 
-    # Default: find all PDFs in current directory
-    cwd = Path.cwd()
-    return sorted(cwd.glob("*.pdf"))
+    # Default: find all PDFs in current directory (one scan, sizes cached)
+    with os.scandir(Path.cwd()) as it:
+        entries = [
+            (entry.name, entry.stat().st_size, Path(entry.path))
+            for entry in it
+            if entry.name.endswith(".pdf") and entry.is_file()
+        ]
+    entries.sort(key=lambda e: e[0])
+
+    for _, size, path in entries:
+        _file_sizes[path] = size
+    return [path for _, _, path in entries]
+
+
+def get_file_size(path: Path) -> int:
+    """Return file size, using the discovery cache when available."""
+    size = _file_sizes.get(path)
+    if size is None:
+        size = path.stat().st_size
+        _file_sizes[path] = size
+    return size
 
 
 def confirm_operation(
@@ -60,16 +98,17 @@ def confirm_operation(
     """Show operation summary and ask for confirmation."""
     cwd = Path.cwd()
 
+    file_count = len(files)
+
     console.print()
     console.print(f"[bold]Working directory:[/bold] {cwd}")
-    console.print(f"[bold]Files to compress:[/bold] {len(files)}")
+    console.print(f"[bold]Files to compress:[/bold] {file_count}")
 
-    # Show sample file names (up to 5)
-    sample_count = min(5, len(files))
-    for f in files[:sample_count]:
-        console.print(f"  • {f.name}")
-    if len(files) > sample_count:
-        console.print(f"  ... and {len(files) - sample_count} more")
+    # Show sample file names (up to 5) in a single render
+    sample = "\n".join(f"  • {f.name}" for f in files[:5])
+    if file_count > 5:
+        sample += f"\n  ... and {file_count - 5} more"
+    console.print(sample, markup=False)
 
     # Show output destination
     if in_place:
@@ -194,12 +233,12 @@ def main(
         console.print("[red]Error:[/red] Cannot use --dry-run with -o or -i.")
         raise typer.Exit(1)
 
-    # Validate quality preset
-    valid_qualities = ["screen", "ebook", "printer", "prepress", "default"]
-    if quality.lower() not in valid_qualities:
+    # Validate quality preset (normalized once, passed on lowercased)
+    q = quality.lower()
+    if q not in _VALID_QUALITIES:
         console.print(
             f"[red]Error:[/red] Invalid quality '{quality}'. "
-            f"Choose from: {', '.join(valid_qualities)}"
+            f"Choose from: {', '.join(_QUALITY_CHOICES)}"
         )
         raise typer.Exit(1)
 
@@ -210,8 +249,8 @@ def main(
         console.print(get_install_instructions())
         raise typer.Exit(1)
 
-    # Create output directory if needed
-    if output_dir:
+    # Create output directory if needed (dry-run never writes output files)
+    if output_dir and not dry_run:
         output_dir.mkdir(parents=True, exist_ok=True)
 
     # Confirm operation (skip in dry-run or quiet mode)
@@ -220,35 +259,57 @@ def main(
             console.print("Operation cancelled.")
             raise typer.Exit(0)
 
+    # Summary rows are collected as each file completes
+    summary = SummaryAccumulator(files) if not quiet and len(files) > 1 else None
+
     # Process files
-    if dry_run:
-        # Use temporary directory that auto-cleans on exit
-        with TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            if len(files) > 1 and jobs != 1:
-                outcomes = process_parallel(files, temp_path, False, quality, jobs, quiet)
-            else:
-                outcomes = process_sequential(files, None, temp_path, False, quality, quiet)
-            # Summary shown before temp dir cleanup
-            if not quiet and len(outcomes) > 1:
-                show_summary(outcomes)
+    if len(files) > 1 and jobs != 1:
+        # Parallel processing for multiple files
+        outcomes = process_parallel(files, output_dir, in_place, q, jobs, quiet, dry_run, summary)
     else:
-        if len(files) > 1 and jobs != 1:
-            # Parallel processing for multiple files
-            outcomes = process_parallel(files, output_dir, in_place, quality, jobs, quiet)
-        else:
-            # Sequential processing
-            outcomes = process_sequential(files, output, output_dir, in_place, quality, quiet)
+        # Sequential processing; a lone file runs its strategies concurrently unless -j 1
+        outcomes = process_sequential(
+            files,
+            output,
+            output_dir,
+            in_place,
+            q,
+            quiet,
+            dry_run,
+            summary,
+            parallel_strategies=len(files) == 1 and jobs != 1,
+        )
 
-        # Summary
-        if not quiet and len(outcomes) > 1:
-            show_summary(outcomes)
+    # Summary
+    if summary is not None:
+        show_summary(summary)
 
     # Exit with error if any compression failed completely
     if any(o.best_strategy == "error" for o in outcomes):
         raise typer.Exit(1)
 
 
+def use_progress(quiet: bool) -> bool:
+    """Return True if a live progress bar should be shown."""
+    # Rich runs a refresh thread even for a disabled Progress, so skip it
+    # entirely when quiet or when output isn't going to a terminal
+    return not quiet and console.is_terminal
+
+
+def create_progress() -> "Progress":
+    """Create the progress bar used while compressing files."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+        refresh_per_second=4,
+    )
+
+
 def process_sequential(
     files: List[Path],
     output: Optional[Path],
@@ -256,32 +317,37 @@ def process_sequential(
     in_place: bool,
     quality: str,
     quiet: bool,
-) -> List[CompressionOutcome]:
+    dry_run: bool = False,
+    summary: Optional["SummaryAccumulator"] = None,
+    parallel_strategies: bool = False,
+) -> List["CompressionOutcome"]:
     """Process files sequentially with progress display."""
-    outcomes = []
-    compressor = PDFCompressor(quality=quality)
+    from pdf_squeezer.core.compressor import PDFCompressor
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-        disable=quiet,
-    ) as progress:
-        task = progress.add_task("Compressing...", total=len(files))
+    compressor = PDFCompressor(quality=quality, parallel_strategies=parallel_strategies)
 
-        for input_path in files:
-            output_path = resolve_output_path(input_path, output, output_dir, in_place)
+    def compress_file(input_path: Path) -> "CompressionOutcome":
+        output_path = resolve_output_path(input_path, output, output_dir, in_place)
+        outcome = compressor.compress(
+            input_path, output_path, dry_run=dry_run, original_size=get_file_size(input_path)
+        )
+        report_outcome(outcome, quiet, summary)
+        return outcome
 
-            progress.update(task, description=f"[cyan]{input_path.name}[/cyan]")
-            outcome = compressor.compress(input_path, output_path)
-            outcomes.append(outcome)
+    if not use_progress(quiet):
+        return [compress_file(input_path) for input_path in files]
 
-            if not quiet:
-                show_result(outcome)
+    outcomes = []
+    with create_progress() as progress:
+        task = progress.add_task("Compressing...", total=len(files))
 
-            progress.advance(task)
+        # One update per file: completed count and current name together
+        for completed, input_path in enumerate(files):
+            progress.update(
+                task, description=f"[cyan]{input_path.name}[/cyan]", completed=completed
+            )
+            outcomes.append(compress_file(input_path))
+        progress.update(task, completed=len(files))
 
     return outcomes
 
@@ -293,35 +359,48 @@ def process_parallel(
     quality: str,
     jobs: int,
     quiet: bool,
-) -> List[CompressionOutcome]:
+    dry_run: bool = False,
+    summary: Optional["SummaryAccumulator"] = None,
+) -> List["CompressionOutcome"]:
     """Process files in parallel with progress display."""
+    from pdf_squeezer.parallel.executor import ParallelCompressor
+
     parallel_compressor = ParallelCompressor(
         quality=quality,
         max_workers=jobs if jobs > 0 else None,
+        dry_run=dry_run,
     )
 
-    # Prepare tasks
-    tasks = []
+    # Prepare tasks, largest files first so a big PDF doesn't end up running
+    # alone on one worker while the others sit idle
+    sized = []
     for input_path in files:
         output_path = resolve_output_path(input_path, None, output_dir, in_place)
-        tasks.append((input_path, output_path))
+        sized.append((get_file_size(input_path), input_path, output_path))
+    sized.sort(key=lambda t: t[0], reverse=True)
+    tasks = [(input_path, output_path) for _, input_path, output_path in sized]
+    sizes = [size for size, _, _ in sized]
+
+    if not use_progress(quiet):
+        if quiet:
+            return parallel_compressor.compress_batch(tasks, sizes=sizes)
+        return parallel_compressor.compress_batch(
+            tasks, lambda outcome: report_outcome(outcome, quiet, summary), sizes
+        )
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-        disable=quiet,
-    ) as progress:
+    with create_progress() as progress:
         task_id = progress.add_task("Compressing files...", total=len(tasks))
 
-        def on_complete(outcome: CompressionOutcome) -> None:
-            progress.advance(task_id)
-            if not quiet:
-                show_result(outcome)
+        completed = 0
+
+        def on_complete(outcome: "CompressionOutcome") -> None:
+            # Set the absolute count; Rich coalesces these between refreshes
+            nonlocal completed
+            completed += 1
+            progress.update(task_id, completed=completed)
+            report_outcome(outcome, quiet, summary)
 
-        outcomes = parallel_compressor.compress_batch(tasks, on_complete)
+        outcomes = parallel_compressor.compress_batch(tasks, on_complete, sizes)
 
     return outcomes
 
@@ -342,46 +421,73 @@ def resolve_output_path(
     return input_path.parent / f"{input_path.stem}.compressed.pdf"
 
 
-def show_result(outcome: CompressionOutcome) -> None:
+def report_outcome(
+    outcome: "CompressionOutcome",
+    quiet: bool,
+    summary: Optional["SummaryAccumulator"],
+) -> None:
+    """Show a finished file's result and add it to the batch summary."""
+    if not quiet:
+        show_result(outcome)
+    if summary is not None:
+        summary.add(outcome)
+
+
+def show_result(outcome: "CompressionOutcome") -> None:
     """Display compression result for a single file."""
     name = outcome.input_path.name
     orig = format_size(outcome.original_size)
     final = format_size(outcome.final_size)
 
+    # Styled Text segments instead of inline markup: printed once per file,
+    # so skip the markup parser (and file names with "[" are shown verbatim)
     if outcome.best_strategy == "error":
-        console.print(f"  [bold]{name}[/bold] [red]ERROR[/red]")
+        line = Text.assemble("  ", (name, "bold"), " ", ("ERROR", "red"))
     elif outcome.improved:
-        console.print(
-            f"  [bold]{name}[/bold] {orig} -> [green]{final}[/green] "
-            f"([green]-{outcome.reduction_percent}%[/green]) via {outcome.best_strategy}"
+        line = Text.assemble(
+            "  ",
+            (name, "bold"),
+            f" {orig} -> ",
+            (final, "green"),
+            " (",
+            (f"-{outcome.reduction_percent}%", "green"),
+            f") via {outcome.best_strategy}",
         )
     else:
-        console.print(f"  [bold]{name}[/bold] {orig} -> [yellow]{final}[/yellow] (no reduction)")
+        line = Text.assemble(
+            "  ", (name, "bold"), f" {orig} -> ", (final, "yellow"), " (no reduction)"
+        )
+    console.print(line)
 
 
-def show_summary(outcomes: List[CompressionOutcome]) -> None:
-    """Display summary table for batch operations."""
-    table = Table(title="Compression Summary")
-    table.add_column("File", style="cyan")
-    table.add_column("Original", justify="right")
-    table.add_column("Compressed", justify="right")
-    table.add_column("Reduction", justify="right")
-    table.add_column("Strategy")
+class SummaryAccumulator:
+    """
+    Collects summary rows and running totals as files complete.
 
-    total_original = 0
-    total_final = 0
+    Files may finish in any order (parallel batches run largest first), so
+    each row is kept with its input position and the table is built in
+    input order by finalize().
+    """
+
+    def __init__(self, files: List[Path]) -> None:
+        self._positions = {path: i for i, path in enumerate(files)}
+        self._rows: List[Tuple[int, Tuple[str, str, str, str, str]]] = []
 
-    for o in outcomes:
-        total_original += o.original_size
-        total_final += o.final_size
+        self.total_original = 0
+        self.total_final = 0
+
+    def add(self, o: "CompressionOutcome") -> None:
+        """Record the row for a completed file and update the totals."""
+        self.total_original += o.original_size
+        self.total_final += o.final_size
 
         if o.best_strategy == "error":
-            table.add_row(o.input_path.name, format_size(o.original_size), "-", "[red]ERROR[/red]", "-")
+            row = (o.input_path.name, format_size(o.original_size), "-", "[red]ERROR[/red]", "-")
         else:
             reduction = f"-{o.reduction_percent}%" if o.improved else "0%"
             style = "green" if o.improved else "yellow"
 
-            table.add_row(
+            row = (
                 o.input_path.name,
                 format_size(o.original_size),
                 format_size(o.final_size),
@@ -389,18 +495,41 @@ def show_summary(outcomes: List[CompressionOutcome]) -> None:
                 o.best_strategy,
             )
 
-    # Total row
-    total_reduction = int((1 - total_final / total_original) * 100) if total_original else 0
-    table.add_row(
-        "[bold]TOTAL[/bold]",
-        f"[bold]{format_size(total_original)}[/bold]",
-        f"[bold]{format_size(total_final)}[/bold]",
-        f"[bold green]-{total_reduction}%[/bold green]",
-        "",
-    )
+        position = self._positions.get(o.input_path, len(self._positions))
+        self._rows.append((position, row))
+
+    def finalize(self) -> "Table":
+        """Build the table in input order, with the total row appended."""
+        from rich.table import Table
+
+        table = Table(title="Compression Summary")
+        table.add_column("File", style="cyan")
+        table.add_column("Original", justify="right")
+        table.add_column("Compressed", justify="right")
+        table.add_column("Reduction", justify="right")
+        table.add_column("Strategy")
+
+        self._rows.sort(key=lambda r: r[0])
+        for _, row in self._rows:
+            table.add_row(*row)
+
+        total_reduction = 0
+        if self.total_original:
+            total_reduction = (self.total_original - self.total_final) * 100 // self.total_original
+        table.add_row(
+            "[bold]TOTAL[/bold]",
+            f"[bold]{format_size(self.total_original)}[/bold]",
+            f"[bold]{format_size(self.total_final)}[/bold]",
+            f"[bold green]-{total_reduction}%[/bold green]",
+            "",
+        )
+        return table
+
 
+def show_summary(summary: SummaryAccumulator) -> None:
+    """Display summary table for batch operations."""
     console.print()
-    console.print(table)
+    console.print(summary.finalize())
 
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 """Main PDF compression orchestrator."""
 
+import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
@@ -11,6 +13,57 @@ from pdf_squeezer.core.strategies.combined_strategy import CombinedStrategy
 from pdf_squeezer.core.strategies.ghostscript_strategy import GhostscriptStrategy
 from pdf_squeezer.core.strategies.pikepdf_strategy import PikepdfStrategy
 
+# Linearized PDFs smaller than this are already optimized and rarely shrink
+SKIP_LINEARIZED_BELOW = 100_000
+
+# Bytes read from the start of a file to find the linearization dictionary
+_HEADER_PROBE_SIZE = 1024
+
+
+def should_attempt(path: Path, size: Optional[int] = None) -> bool:
+    """
+    Return False for small, already-linearized PDFs not worth compressing.
+
+    Args:
+        path: Path to input PDF file
+        size: File size if already known (skips a stat call)
+
+    Returns:
+        True if the compression strategies should be run
+    """
+    if size is None:
+        size = path.stat().st_size
+    if size >= SKIP_LINEARIZED_BELOW:
+        return True
+
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_HEADER_PROBE_SIZE)
+    except OSError:
+        # Let the strategies report the problem
+        return True
+
+    return b"/Linearized" not in head
+
+
+def _replace_atomically(source: Path, output_path: Path) -> None:
+    """
+    Copy source to output_path via a temp file next to it and os.replace.
+
+    The destination is never left half-written, which matters for in-place
+    mode where output_path is the original input file.
+    """
+    # Unique name, so existing files and concurrent writers aren't clobbered
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=output_path.name, suffix=".tmp")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 @dataclass
 class CompressionOutcome:
@@ -28,7 +81,7 @@ class CompressionOutcome:
         """Return the reduction percentage."""
         if self.original_size == 0:
             return 0
-        return int((1.0 - self.final_size / self.original_size) * 100)
+        return (self.original_size - self.final_size) * 100 // self.original_size
 
     @property
     def improved(self) -> bool:
@@ -45,26 +98,49 @@ class PDFCompressor:
     def __init__(
         self,
         quality: str = "screen",
+        parallel_strategies: bool = False,
+        combined_skip_threshold: float = 0.40,
     ):
         """
         Initialize the compressor.
 
         Args:
             quality: Quality preset (screen, ebook, printer, prepress)
+            parallel_strategies: Run the strategies for a file concurrently
+                (for single-file runs; batches parallelize across files instead)
+            combined_skip_threshold: In serial mode, skip the combined strategy
+                when pikepdf alone already reduces the file by more than this ratio
         """
         self.quality = quality
-
-        # Initialize strategies
+        self.parallel_strategies = parallel_strategies
+        self.combined_skip_threshold = combined_skip_threshold
+
+        # Initialize strategies once; CombinedStrategy reuses the same instances
+        self.pikepdf_strategy = PikepdfStrategy()
+        gs_strategy = GhostscriptStrategy()
+        self.combined_strategy = CombinedStrategy(
+            gs_strategy=gs_strategy, pikepdf_strategy=self.pikepdf_strategy
+        )
         self.strategies: List[CompressionStrategy] = [
-            PikepdfStrategy(),
-            GhostscriptStrategy(),
-            CombinedStrategy(),
+            self.pikepdf_strategy,
+            gs_strategy,
+            self.combined_strategy,
         ]
 
+    def _skip_combined(self, pikepdf_result: Optional[CompressionResult]) -> bool:
+        """Return True if pikepdf already reduced the file past the threshold."""
+        return (
+            pikepdf_result is not None
+            and pikepdf_result.success
+            and pikepdf_result.reduction_ratio > self.combined_skip_threshold
+        )
+
     def compress(
         self,
         input_path: Path,
         output_path: Path,
+        dry_run: bool = False,
+        original_size: Optional[int] = None,
     ) -> CompressionOutcome:
         """
         Compress a PDF using all strategies and keep the best result.
@@ -72,21 +148,59 @@ class PDFCompressor:
         Args:
             input_path: Path to input PDF file
             output_path: Path for output file
+            dry_run: Measure the best result without writing output_path
+            original_size: Input size if already known (skips a stat call)
 
         Returns:
             CompressionOutcome with details about the compression
         """
-        original_size = input_path.stat().st_size
-        results: List[CompressionResult] = []
+        if original_size is None:
+            original_size = input_path.stat().st_size
+
+        # Triage: keep small linearized files as they are
+        if not should_attempt(input_path, original_size):
+            if not dry_run and output_path != input_path:
+                _replace_atomically(input_path, output_path)
+            return CompressionOutcome(
+                input_path=input_path,
+                output_path=output_path,
+                original_size=original_size,
+                final_size=original_size,
+                best_strategy="skipped",
+                all_results=[],
+            )
 
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir_path = Path(tmpdir)
 
-            # Try each strategy
-            for i, strategy in enumerate(self.strategies):
-                strategy_output = tmpdir_path / f"strategy_{i}.pdf"
-                result = strategy.compress(input_path, strategy_output, self.quality)
-                results.append(result)
+            # Try each strategy, each writing to its own temp output
+            strategy_outputs = {
+                strategy: tmpdir_path / f"strategy_{i}.pdf"
+                for i, strategy in enumerate(self.strategies)
+            }
+
+            def run_strategy(strategy: CompressionStrategy) -> CompressionResult:
+                return strategy.compress(input_path, strategy_outputs[strategy], self.quality)
+
+            if self.parallel_strategies:
+                # Ghostscript runs as a subprocess and qpdf works in C++, so
+                # threads are enough to keep several cores busy. All strategies
+                # start together, so combined is never skipped here: by the time
+                # pikepdf finishes it is already running.
+                with ThreadPoolExecutor(max_workers=len(self.strategies)) as executor:
+                    results = list(executor.map(run_strategy, self.strategies))
+            else:
+                # Serially, combined runs after pikepdf and is skipped when
+                # pikepdf alone is already a large reduction
+                results = []
+                pikepdf_result: Optional[CompressionResult] = None
+                for strategy in self.strategies:
+                    if strategy is self.combined_strategy and self._skip_combined(pikepdf_result):
+                        continue
+                    result = run_strategy(strategy)
+                    if strategy is self.pikepdf_strategy:
+                        pikepdf_result = result
+                    results.append(result)
 
             # Find best result (smallest successful output)
             best_result: Optional[CompressionResult] = None
@@ -99,11 +213,14 @@ class PDFCompressor:
 
             # Save best result or copy original
             if best_result and best_result.output_path:
-                shutil.copy2(best_result.output_path, output_path)
+                if not dry_run:
+                    _replace_atomically(best_result.output_path, output_path)
                 final_size = best_size
                 best_strategy = best_result.strategy_name
             else:
-                shutil.copy2(input_path, output_path)
+                # In-place with no improvement: the original is already there
+                if not dry_run and output_path != input_path:
+                    _replace_atomically(input_path, output_path)
                 final_size = original_size
                 best_strategy = "none"
 
@@ -1,9 +1,7 @@
 """Compression strategy implementations."""
 
-from pdf_squeezer.core.strategies.base import CompressionStrategy, CompressionResult
-from pdf_squeezer.core.strategies.pikepdf_strategy import PikepdfStrategy
-from pdf_squeezer.core.strategies.ghostscript_strategy import GhostscriptStrategy
-from pdf_squeezer.core.strategies.combined_strategy import CombinedStrategy
+from importlib import import_module
+from typing import Any
 
 __all__ = [
     "CompressionStrategy",
@@ -12,3 +10,21 @@ __all__ = [
     "GhostscriptStrategy",
     "CombinedStrategy",
 ]
+
+# Attribute name -> submodule, imported on first access (PEP 562)
+_LAZY_ATTRS = {
+    "CompressionStrategy": "base",
+    "CompressionResult": "base",
+    "PikepdfStrategy": "pikepdf_strategy",
+    "GhostscriptStrategy": "ghostscript_strategy",
+    "CombinedStrategy": "combined_strategy",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import strategy submodules on first attribute access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(f"{__name__}.{module_name}")
+    return getattr(module, name)
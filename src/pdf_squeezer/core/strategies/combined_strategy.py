@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from typing import Optional
 
 from pdf_squeezer.core.strategies.base import CompressionResult, CompressionStrategy
 from pdf_squeezer.core.strategies.ghostscript_strategy import GhostscriptStrategy
@@ -16,10 +17,15 @@ class CombinedStrategy(CompressionStrategy):
 
     name: str = "combined"
 
-    def __init__(self, gs_quality: str = "screen"):
-        """Initialize with Ghostscript quality preset."""
-        self.gs_strategy = GhostscriptStrategy()
-        self.pikepdf_strategy = PikepdfStrategy()
+    def __init__(
+        self,
+        gs_quality: str = "screen",
+        gs_strategy: Optional[GhostscriptStrategy] = None,
+        pikepdf_strategy: Optional[PikepdfStrategy] = None,
+    ):
+        """Initialize with Ghostscript quality preset and optional stage strategies."""
+        self.gs_strategy = gs_strategy or GhostscriptStrategy()
+        self.pikepdf_strategy = pikepdf_strategy or PikepdfStrategy()
         self.gs_quality = gs_quality
 
     def compress(
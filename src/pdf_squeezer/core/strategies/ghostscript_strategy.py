@@ -2,6 +2,7 @@
 
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -31,8 +32,23 @@ class GhostscriptStrategy(CompressionStrategy):
         """Initialize with optional Ghostscript path."""
         self.gs_path = gs_path or self._find_ghostscript()
 
-    def _find_ghostscript(self) -> str:
-        """Find Ghostscript executable."""
+        # Fixed arguments, built once; quality and file paths are added per call
+        self._base_cmd = [
+            self.gs_path,
+            "-sDEVICE=pdfwrite",
+            "-dCompatibilityLevel=1.4",
+            "-dNOPAUSE",
+            "-dQUIET",
+            "-dBATCH",
+            "-dDetectDuplicateImages=true",
+            "-dCompressFonts=true",
+            "-dSubsetFonts=true",
+        ]
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _find_ghostscript() -> str:
+        """Find Ghostscript executable (looked up once per process)."""
         for name in ["gs", "gswin64c", "gswin32c"]:
             if shutil.which(name):
                 return name
@@ -51,25 +67,22 @@ class GhostscriptStrategy(CompressionStrategy):
         original_size = self._get_file_size(input_path)
         pdf_setting = self.QUALITY_SETTINGS.get(quality, "/screen")
 
-        cmd = [
-            self.gs_path,
-            "-sDEVICE=pdfwrite",
-            "-dCompatibilityLevel=1.4",
+        cmd = self._base_cmd + [
             f"-dPDFSETTINGS={pdf_setting}",
-            "-dNOPAUSE",
-            "-dQUIET",
-            "-dBATCH",
-            "-dDetectDuplicateImages=true",
-            "-dCompressFonts=true",
-            "-dSubsetFonts=true",
             f"-sOutputFile={output_path}",
             str(input_path),
         ]
 
         try:
+            # Only stderr is read (for error messages). close_fds=False skips
+            # closing every inherited fd on spawn; Python's own fds are
+            # non-inheritable, so nothing leaks into gs.
             subprocess.run(
                 cmd,
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                close_fds=False,
                 timeout=300,  # 5 minute timeout
                 check=True,
             )
@@ -7,16 +7,32 @@ from typing import Callable, List, Optional, Tuple
 
 from pdf_squeezer.core.compressor import CompressionOutcome, PDFCompressor
 
+# Per-process compressor, created once by _init_worker and reused for every task
+_worker_compressor: Optional[PDFCompressor] = None
 
-def _compress_single(args: Tuple[Path, Path, str]) -> CompressionOutcome:
+
+def _init_worker(quality: str) -> None:
+    """
+    Pool initializer that builds the worker's compressor once.
+
+    Must be at module level for pickling.
+    """
+    global _worker_compressor
+    _worker_compressor = PDFCompressor(quality=quality)
+
+
+def _compress_single(args: Tuple[Path, Path, bool, Optional[int]]) -> CompressionOutcome:
     """
     Worker function for parallel compression.
 
     Must be at module level for pickling.
     """
-    input_path, output_path, quality = args
-    compressor = PDFCompressor(quality=quality)
-    return compressor.compress(input_path, output_path)
+    input_path, output_path, dry_run, original_size = args
+    if _worker_compressor is None:
+        raise RuntimeError("worker not initialized")
+    return _worker_compressor.compress(
+        input_path, output_path, dry_run=dry_run, original_size=original_size
+    )
 
 
 class ParallelCompressor:
@@ -33,6 +49,7 @@ class ParallelCompressor:
         self,
         quality: str = "screen",
         max_workers: Optional[int] = None,
+        dry_run: bool = False,
     ):
         """
         Initialize the parallel compressor.
@@ -40,8 +57,10 @@ class ParallelCompressor:
         Args:
             quality: Quality preset (screen, ebook, printer, prepress)
             max_workers: Number of parallel workers (None = auto)
+            dry_run: Measure results without writing output files
         """
         self.quality = quality
+        self.dry_run = dry_run
         # Default to CPU count, but cap at reasonable limit
         self.max_workers = max_workers or min(os.cpu_count() or 4, 8)
 
@@ -49,6 +68,7 @@ class ParallelCompressor:
         self,
         tasks: List[Tuple[Path, Path]],
         on_complete: Optional[Callable[[CompressionOutcome], None]] = None,
+        sizes: Optional[List[int]] = None,
     ) -> List[CompressionOutcome]:
         """
         Compress multiple PDFs in parallel.
@@ -56,16 +76,25 @@ class ParallelCompressor:
         Args:
             tasks: List of (input_path, output_path) tuples
             on_complete: Callback fired when each file completes
+            sizes: Known input file sizes, in the same order as tasks
 
         Returns:
             List of CompressionOutcome in original order
         """
-        # Prepare args with quality
-        args_list = [(input_path, output_path, self.quality) for input_path, output_path in tasks]
+        # Prepare args with dry-run flag and known size (quality is bound once per worker)
+        known_sizes: List[Optional[int]] = list(sizes) if sizes else [None] * len(tasks)
+        args_list = [
+            (input_path, output_path, self.dry_run, size)
+            for (input_path, output_path), size in zip(tasks, known_sizes, strict=True)
+        ]
 
         outcomes: List[Optional[CompressionOutcome]] = [None] * len(tasks)
 
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.quality,),
+        ) as executor:
             # Submit all tasks
             future_to_index = {
                 executor.submit(_compress_single, args): i for i, args in enumerate(args_list)
@@ -81,11 +110,13 @@ class ParallelCompressor:
                         on_complete(outcome)
                 except Exception as e:
                     # Create error outcome
-                    input_path, output_path, _ = args_list[index]
+                    input_path, output_path, _, size = args_list[index]
+                    if size is None:
+                        size = input_path.stat().st_size if input_path.exists() else 0
                     error_outcome = CompressionOutcome(
                         input_path=input_path,
                         output_path=output_path,
-                        original_size=input_path.stat().st_size if input_path.exists() else 0,
+                        original_size=size,
                         final_size=0,
                         best_strategy="error",
                         all_results=[],
@@ -1,6 +1,9 @@
 """File size formatting utilities."""
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=1024)
 def format_size(bytes_count: int) -> str:
     """
     Format bytes to human-readable string.